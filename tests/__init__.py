@@ -1,5 +1,16 @@
 from __future__ import annotations
 
+import atexit
+import shutil
 from pathlib import Path
 
+_TESTS_ROOT = Path(__file__).resolve().parent
+
 TEST_LOG = Path("test_log.json").resolve()
+DATA_ROOT = _TESTS_ROOT.joinpath("data")
+# Anchored to the repository, not cwd: test_version_hook needs its parent to be
+# the repository root
+TEST_ROOT = _TESTS_ROOT.parent.joinpath(".test")
+
+# Each test works in its own subfolder of TEST_ROOT, remove them all once at exit
+atexit.register(shutil.rmtree, TEST_ROOT, ignore_errors=True)
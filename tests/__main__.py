@@ -1,31 +1,42 @@
 from __future__ import annotations
 
+import contextlib
+import heapq
+import json
 import sys
 import unittest
 
-import autodict
-
-from tests import TEST_LOG
+from tests import base, TEST_LOG
+from tests._log import RESULTS
 from witch_ver.version import __version__, version_dict
 
 
 def pre_tests() -> None:
     """Things to run before all tests."""
     print(f"Testing version {__version__}")
-    if TEST_LOG.exists():
+    with contextlib.suppress(FileNotFoundError):
         TEST_LOG.unlink()
-    with autodict.JSONAutoDict(str(TEST_LOG)) as d:
-        d["version"] = version_dict
-        d["classes"] = {}
-        d["methods"] = {}
+
+
+def save_log() -> None:
+    """Save the accumulated test results to TEST_LOG."""
+    with TEST_LOG.open("w", encoding="utf-8") as file:
+        json.dump({"version": version_dict, **RESULTS}, file, default=str)
 
 
 def post_tests() -> None:
     """Things to run after all tests."""
     n_slowest = 10
-    with autodict.JSONAutoDict(str(TEST_LOG)) as d:
-        classes = sorted(d["classes"].items(), key=lambda item: -item[1])[:n_slowest]
-        methods = sorted(d["methods"].items(), key=lambda item: -item[1])[:n_slowest]
+    classes = heapq.nlargest(
+        n_slowest,
+        RESULTS["classes"].items(),
+        key=lambda item: item[1],
+    )
+    methods = heapq.nlargest(
+        n_slowest,
+        RESULTS["methods"].items(),
+        key=lambda item: item[1],
+    )
 
     print(f"{n_slowest} slowest classes")
     if len(classes) != 0:
@@ -41,7 +52,8 @@ def post_tests() -> None:
 
 
 pre_tests()
-m = unittest.main(module=None, exit=False)
+m = unittest.main(module=None, testRunner=base.TimingRunner, exit=False)
+save_log()
 all_passed = m.result.wasSuccessful()
 if all_passed:
     post_tests()
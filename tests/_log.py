@@ -0,0 +1,27 @@
+"""Test durations, accumulated in memory and saved to TEST_LOG once after all tests."""
+
+from __future__ import annotations
+
+import threading
+
+RESULTS: dict = {"classes": {}, "methods": {}, "speed": {}}
+_RESULTS_LOCK = threading.Lock()
+
+
+def record_class(name: str, duration: float) -> None:
+    with _RESULTS_LOCK:
+        RESULTS["classes"][name] = duration
+
+
+def record_method(name: str, duration: float) -> None:
+    with _RESULTS_LOCK:
+        RESULTS["methods"][name] = duration
+
+
+def record_speed(name: str, slow_duration: float, fast_duration: float) -> None:
+    with _RESULTS_LOCK:
+        RESULTS["speed"][name] = {
+            "slow": slow_duration,
+            "fast": fast_duration,
+            "increase": slow_duration / fast_duration,
+        }
@@ -1,44 +1,224 @@
+"""Common test helpers.
+
+Nothing is patched globally for every test, a test that runs code which sleeps
+should patch it locally, i.e. with swap_attr(time, "sleep", ...).
+"""
+
 from __future__ import annotations
 
+import contextlib
+import functools
 import importlib.util
+import io
+import os
+import pathlib
 import random
 import shutil
-import string
 import sys
 import time
+import typing as t
 import unittest
-from pathlib import Path
+import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
-import autodict
-
-from tests import TEST_LOG
+from tests import DATA_ROOT, TEST_ROOT
+from tests._log import record_class, record_method, record_speed
+from witch_ver import git, semver
 
 if TYPE_CHECKING:
+    from pathlib import Path
     from types import ModuleType
 
+# Tests that run git, skip them with WITCH_VER_SKIP_SLOW=1 for quick iteration
+slow = unittest.skipIf(
+    bool(os.environ.get("WITCH_VER_SKIP_SLOW")),
+    "WITCH_VER_SKIP_SLOW is set",
+)
 
-class TestBase(unittest.TestCase):
-    _TEST_ROOT = Path.cwd().joinpath(".test").resolve()
-    _DATA_ROOT = Path(__file__).resolve().parent.joinpath("data")
+# Filler contents, fixed so the newline tests need no RNG and are repeatable
+FIXED_LINES = [f"line-{i:02}-{'x' * 10}" for i in range(11)]
 
-    # For pathlib mocking
-    is_py_3_10 = (
-        sys.version_info[0] == 3 and sys.version_info[1] == 10  # noqa: PLR2004, YTT201
-    )
+T = t.TypeVar("T")
 
-    @classmethod
-    def random_string(cls, length: int = 20) -> str:
-        """Generate a random string a-zA-Z.
+_EXTRACTED: t.Set[Path] = set()
 
-        Args:
-            length: Length of string to generate
+_COPY_BUFFER = 1 << 20
+_SKIP_SUFFIX = ".sample"
+_IS_PY_3_10 = sys.version_info[:2] == (3, 10)
+
+
+def _is_extracted(path: Path) -> bool:
+    # Marker is written after a complete extraction, next to the folder so git
+    # doesn't see it as an untracked file, a stale marker of a deleted folder
+    # doesn't count
+    if not path.is_dir():
+        return False
+    try:
+        marker_mtime = path.with_suffix(".extracted").stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return marker_mtime >= path.with_suffix(".zip").stat().st_mtime
+
+
+def _extract_zip(path: Path) -> None:
+    # Extract beside the folder and swap it in once complete, so an interrupted
+    # extraction never leaves a partial folder at path
+    tmp = path.with_name(f"{path.name}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    with zipfile.ZipFile(path.with_suffix(".zip"), "r") as z_file:
+        # Larger copy buffer than extractall to cut read/write syscalls
+        for info in z_file.infolist():
+            # Hook samples are most of the bytes and git never reads them
+            if info.filename.endswith(_SKIP_SUFFIX):
+                continue
+            target = tmp.joinpath(info.filename)
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with z_file.open(info) as src, target.open(
+                "wb",
+                buffering=_COPY_BUFFER,
+            ) as dst:
+                # Size the file up front so the filesystem isn't growing it per
+                # write, the copy then overwrites in place from the start
+                dst.truncate(info.file_size)
+                shutil.copyfileobj(src, dst, _COPY_BUFFER)
+    # Remove any outdated extraction
+    shutil.rmtree(path, ignore_errors=True)
+    tmp.replace(path)
+    path.with_suffix(".extracted").touch()
+
+
+def extract_zips(paths: t.Iterable[Path]) -> None:
+    """Extract zipped test data, each only once per session.
+
+    Can't commit a git repo to this repo, test repos are zipped instead.
+    Archives are independent so extract them in parallel. A folder is
+    re-extracted if its last extraction was interrupted or the zip is newer.
+
+    Args:
+        paths: Folders to extract, each from the sibling {path}.zip
+    """
+    paths = [p for p in paths if p not in _EXTRACTED]
+    todo = [p for p in paths if not _is_extracted(p)]
+    if todo:
+        with ThreadPoolExecutor(max_workers=len(todo)) as executor:
+            list(executor.map(_extract_zip, todo))
+    _EXTRACTED.update(paths)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device or a filesystem without hardlinks
+        shutil.copy2(src, dst)
+
+
+def clone_tree(src: Path, dst: Path, writable: t.Iterable[str] = ()) -> None:
+    """Clone a fixture folder by hardlinking its files instead of copying them.
+
+    Args:
+        src: Folder to clone
+        dst: Destination folder, must not exist
+        writable: Files, relative to src, the test modifies in place. These are
+            copied so the writes don't reach the fixture
+    """
+    shutil.copytree(src, dst, copy_function=_link_or_copy)
+    for name in writable:
+        path = dst.joinpath(name)
+        if path.exists():
+            path.unlink()
+            shutil.copy2(src.joinpath(name), path)
+
+
+@functools.lru_cache(maxsize=None)
+def fetch(path: Path, **kwargs: t.Any) -> git.GitVer:  # noqa: ANN401
+    """Fetch a fixture repo, running git only once per session per arguments.
+
+    Fixture repos don't change during a session, do not modify the result.
+
+    Args:
+        path: Path to repository folder
+        kwargs: Other arguments passed to git.fetch
+
+    Returns:
+        git.fetch(path, **kwargs)
+    """
+    return git.fetch(path, **kwargs)
+
+
+@contextlib.contextmanager
+def swap_attr(obj: object, name: str, new: T) -> t.Iterator[T]:
+    """Temporarily replace an attribute, mock.patch without creating a Mock.
+
+    Args:
+        obj: Object to modify
+        name: Name of the attribute
+        new: Replacement, the original is restored on exit
+
+    Yields:
+        new
+    """
+    original = getattr(obj, name)
+    setattr(obj, name, new)
+    try:
+        yield new
+    finally:
+        setattr(obj, name, original)
 
-        Returns:
-            Random string
-        """
-        # Not cryptographic
-        return "".join(random.choices(string.ascii_letters, k=length))  # noqa: S311
+
+@contextlib.contextmanager
+def chdir(path: Path) -> t.Iterator[None]:
+    """Temporarily change the working directory, contextlib.chdir before 3.11.
+
+    Args:
+        path: New working directory, the original is restored on exit
+    """
+    original = os.getcwd()  # noqa: PTH109
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(original)
+
+
+@contextlib.contextmanager
+def record_open(path: t.Union[Path, None] = None) -> t.Iterator[t.List[str]]:
+    """Record the mode of every file opened by path, through io.open or pathlib.
+
+    Opens of file descriptors, i.e. subprocess pipes, aren't recorded.
+
+    Args:
+        path: Only record opens of this file, None will record every file
+
+    Yields:
+        Modes of each open, in order
+    """
+    original_open = io.open
+    modes: t.List[str] = []
+    target = None if path is None else os.fspath(path)
+
+    def recorder(file: str, *args, **kwargs) -> object:  # noqa: ANN002, ANN003
+        if not isinstance(file, int) and (target is None or os.fspath(file) == target):
+            modes.append(args[0] if args else kwargs.get("mode", "r"))
+        return original_open(file, *args, **kwargs)
+
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(swap_attr(io, "open", recorder))
+        # For 3.10 pathlib used an accessor model, patch that too
+        if _IS_PY_3_10:
+            accessor = pathlib._normal_accessor  # type: ignore[attr-defined] # noqa: SLF001
+            stack.enter_context(swap_attr(accessor, "open", recorder))
+        yield modes
+
+
+class TestBase(unittest.TestCase):
+    _TEST_ROOT = TEST_ROOT
+    _DATA_ROOT = DATA_ROOT
 
     @classmethod
     def random_int(cls, min_: int, max_: int) -> int:
@@ -49,6 +229,34 @@ class TestBase(unittest.TestCase):
     def random_sha(cls) -> str:
         return f"{random.getrandbits(64):X}"
 
+    @classmethod
+    def semver_fixture(
+        cls,
+        major: int,
+        minor: int,
+        patch: int,
+        prerelease: t.Union[str, None] = None,
+        build: t.Union[str, None] = None,
+    ) -> t.Tuple[str, semver.SemVer]:
+        """Format a SemVer string once and parse it.
+
+        Args:
+            major: Major revision number
+            minor: Minor revision number
+            patch: Patch revision number
+            prerelease: Prerelease tags, omitted if None
+            build: Build metadata tags, omitted if None
+
+        Returns:
+            (version string, SemVer parsed from it)
+        """
+        s = f"{major}.{minor}.{patch}"
+        if prerelease is not None:
+            s += f"-{prerelease}"
+        if build is not None:
+            s += f"+{build}"
+        return s, semver.SemVer(s)
+
     @classmethod
     def import_file(cls, path: Path) -> ModuleType:
         name = path.name.strip(".py")
@@ -60,35 +268,16 @@ class TestBase(unittest.TestCase):
         spec.loader.exec_module(module)
         return module
 
-    def __clean_test_root(self) -> None:
-        if self._TEST_ROOT.exists():
-            shutil.rmtree(self._TEST_ROOT)
-
     def setUp(self) -> None:
-        self.__clean_test_root()
-        self._TEST_ROOT.mkdir(parents=True, exist_ok=True)
-        self._test_start = time.perf_counter()
-
-        # Remove sleeping by default, mainly in read hardware interaction
-        self._original_sleep = time.sleep
-        time.sleep = lambda *_: None
+        # Fresh folder per test, only holds the files that test creates
+        self._test_dir = self._TEST_ROOT.joinpath(f"t{uuid.uuid4().hex}")
+        self._test_dir.mkdir(parents=True, exist_ok=True)
 
     def tearDown(self) -> None:
-        duration = time.perf_counter() - self._test_start
-        with autodict.JSONAutoDict(str(TEST_LOG)) as d:
-            d["methods"][self.id()] = duration
-        self.__clean_test_root()
-
-        # Restore sleeping
-        time.sleep = self._original_sleep
+        shutil.rmtree(self._test_dir, ignore_errors=True)
 
     def log_speed(self, slow_duration: float, fast_duration: float) -> None:
-        with autodict.JSONAutoDict(str(TEST_LOG)) as d:
-            d["speed"][self.id()] = {
-                "slow": slow_duration,
-                "fast": fast_duration,
-                "increase": slow_duration / fast_duration,
-            }
+        record_speed(self.id(), slow_duration, fast_duration)
 
     @classmethod
     def setUpClass(cls) -> None:
@@ -99,5 +288,20 @@ class TestBase(unittest.TestCase):
     def tearDownClass(cls) -> None:
         print("]done", flush=True)
         duration = time.perf_counter() - cls._CLASS_START
-        with autodict.JSONAutoDict(str(TEST_LOG)) as d:
-            d["classes"][f"{cls.__module__}.{cls.__qualname__}"] = duration
+        record_class(f"{cls.__module__}.{cls.__qualname__}", duration)
+
+
+class TimingResult(unittest.TextTestResult):
+    """Test result that records the duration of every test."""
+
+    def startTest(self, test: unittest.TestCase) -> None:  # noqa: N802
+        self._test_start = time.perf_counter()
+        super().startTest(test)
+
+    def stopTest(self, test: unittest.TestCase) -> None:  # noqa: N802
+        super().stopTest(test)
+        record_method(test.id(), time.perf_counter() - self._test_start)
+
+
+class TimingRunner(unittest.TextTestRunner):
+    resultclass = TimingResult
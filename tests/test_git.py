@@ -2,27 +2,152 @@ from __future__ import annotations
 
 import datetime
 import time
-import zipfile
-
-import time_machine
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from unittest import mock
 
 from tests import base
 from witch_ver import git
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Commit dates of the fixture repos as POSIX timestamps, parsed once
+_TS_GIT_0 = datetime.datetime.fromisoformat("2022-07-18T11:01:26-07:00").timestamp()
+_TS_GIT_2 = datetime.datetime.fromisoformat("2022-07-18T11:55:17-07:00").timestamp()
+_TS_GIT_3_4_5 = datetime.datetime.fromisoformat("2022-07-18T12:06:25-07:00").timestamp()
+_TS_GIT_7 = datetime.datetime.fromisoformat("2023-08-23T12:53:05-07:00").timestamp()
+
+# Git info checked by assert_git_info, expected values are given in this order
+_GIT_INFO = ("sha", "sha_abbrev", "branch", "date", "is_dirty", "distance", "tag")
+
+# Fixture repo index, arguments to fetch it with and the expected git info in
+# the order of assert_git_info
+_FETCH_TABLE = (
+    # git-0 has a branch and is dirty
+    (
+        0,
+        {},
+        (
+            "dd0ae6e1409910a9189da369864554785f9b0d01",
+            "dd0ae6e",
+            "feat/nothing",
+            _TS_GIT_0,
+            True,
+            0,
+            "v1.2.3-rc1",
+        ),
+    ),
+    # git-2 has a branch but is detached
+    (
+        2,
+        {},
+        (
+            "b23ba426ab23f9bf525691e7550fc57afee48dd8",
+            "b23ba42",
+            "feat/something",
+            _TS_GIT_2,
+            True,
+            1,
+            "v0.0.0",
+        ),
+    ),
+    # git-3 is detached from the master branch
+    # Has a change in the index but reverted in the working tree
+    (
+        3,
+        {"tag_prefix": None},
+        (
+            "f70f3f504000d80d45922c213e3cc3dba9bc8e2c",
+            "f70f3f5",
+            "master",
+            _TS_GIT_3_4_5,
+            False,
+            1,
+            "0.0.0",
+        ),
+    ),
+    # git-4 has no branches but is detached
+    # Has a change in the index
+    (
+        4,
+        {},
+        (
+            "f70f3f504000d80d45922c213e3cc3dba9bc8e2c",
+            "f70f3f5",
+            None,
+            _TS_GIT_3_4_5,
+            True,
+            2,
+            None,
+        ),
+    ),
+)
+
+# git-6 with every piece of git info in the prerelease or build tags
+_SHA_GIT_6 = "ea4d6f6162f033dd6a8056498def4d42980a531f"
+_TAGS_GIT_6 = f"p0.dirty.g{_SHA_GIT_6}.g{_SHA_GIT_6[:7]}.20220719T185017Z"
+_SEMVER_GIT_6_PRE = f"0.0.0-rc1.{_TAGS_GIT_6}"
+_SEMVER_GIT_6_BUILD = f"0.0.0-rc1+{_TAGS_GIT_6}"
+
+# Round trip of GitVer through asdict, values don't matter just that they survive
+_DICT_DATE_ISO = "2023-08-23T19:53:05+00:00"
+_DICT_TARGET = {
+    "tag": "v12.34.56-rc1",
+    "tag_prefix": "v",
+    "sha": _SHA_GIT_6,
+    "sha_abbrev": _SHA_GIT_6[:7],
+    "branch": "master",
+    "date": datetime.datetime.fromisoformat(_DICT_DATE_ISO),
+    "dirty": False,
+    "distance": 42,
+    "pretty_str": "v12.34.56-rc1",
+    "git_dir": "something",
+}
+
 
 class TestGit(base.TestBase):
     @classmethod
     def setUpClass(cls) -> None:
         super().setUpClass()
+        cls._REPO_PATHS = tuple(cls._DATA_ROOT.joinpath(f"git-{i}") for i in range(8))
 
-        # Can't commit a git repo to this repo
-        # Test repos are zipped, extract before testing
-        for i in range(8):
-            path = cls._DATA_ROOT.joinpath(f"git-{i}")
-            if not path.exists():
-                z = path.with_suffix(".zip")
-                with zipfile.ZipFile(z, "r") as z_file:
-                    z_file.extractall(path)
+    @classmethod
+    def _repo(cls, i: int) -> Path:
+        """Get the path to a fixture repo, extracting it on first use.
+
+        Args:
+            i: Index of the git-{i} repo
+
+        Returns:
+            Path to the extracted repo
+        """
+        path = cls._REPO_PATHS[i]
+        base.extract_zips((path,))
+        return path
+
+    @staticmethod
+    def _count_runs() -> t.ContextManager[mock.Mock]:
+        """Count the git commands run, still running them.
+
+        Returns:
+            Context manager yielding the counting mock of git.runner.run
+        """
+        return base.swap_attr(git.runner, "run", mock.Mock(wraps=git.runner.run))
+
+    def assert_git_info(self, g: git.GitVer, target: tuple) -> None:
+        """Assert the git information of a GitVer in one comparison.
+
+        Args:
+            g: Version to check
+            target: Expected (sha, sha_abbrev, branch, date as timestamp, is_dirty,
+                distance, tag)
+        """
+        # Compare as dictionaries so a failure names the mismatched fields
+        info = {k: getattr(g, k) for k in _GIT_INFO}
+        info["date"] = g.date.timestamp()
+        self.assertDictEqual(info, dict(zip(_GIT_INFO, target)))
 
     def test_init(self) -> None:
         g = git.GitVer()
@@ -34,192 +159,120 @@ class TestGit(base.TestBase):
 
         self.assertRaises(TypeError, git.GitVer, tag=s, not_a_keyword=None)
 
+    @base.slow
     def test_fetch(self) -> None:
-        path = self._DATA_ROOT.joinpath("git-0")
+        path = self._repo(0)
         # This will always be in a git repo of witch-ver,
         # shouldn't touch the parent, so mock the call
-        original_run = git.runner.run
-        try:
-            git.runner.run = lambda *args, **kwargs: (  # noqa: ARG005
+        not_a_repo = mock.Mock(
+            return_value=(
                 "fatal: not a git repository (or any of the parent directories): .git",
                 128,
-            )
-            self.assertRaises(RuntimeError, git.fetch, path)
-        finally:
-            git.runner.run = original_run
-
-        # git-0 has a branch and is dirty
-        path = self._DATA_ROOT.joinpath("git-0")
-        g = git.fetch(path)
-        self.assertEqual(g.sha, "dd0ae6e1409910a9189da369864554785f9b0d01")
-        self.assertEqual(g.sha_abbrev, "dd0ae6e")
-        self.assertEqual(g.branch, "feat/nothing")
-        self.assertEqual(
-            g.date,
-            datetime.datetime.fromisoformat("2022-07-18T11:01:26-07:00"),
+            ),
         )
-        self.assertTrue(g.is_dirty)
-        self.assertEqual(g.distance, 0)
-        self.assertEqual(g.tag, "v1.2.3-rc1")
-        self.assertEqual(g.git_dir, path.joinpath(".git"))
+        with base.swap_attr(git.runner, "run", not_a_repo) as mock_run:
+            self.assertRaises(RuntimeError, git.fetch, path)
+        # Gives up on the first failed command, doesn't run the rest
+        self.assertEqual(mock_run.call_count, 1)
+
+        # Extract the table's repos in one parallel batch
+        paths = [self._REPO_PATHS[i] for i, _, _ in _FETCH_TABLE]
+        base.extract_zips(paths)
+
+        # Fetches are waiting on git subprocesses, run them concurrently
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            results = list(
+                executor.map(
+                    lambda path, kwargs: base.fetch(path, **kwargs),
+                    paths,
+                    [kwargs for _, kwargs, _ in _FETCH_TABLE],
+                ),
+            )
+        for path, g, (i, _, target) in zip(paths, results, _FETCH_TABLE):
+            with self.subTest(repo=f"git-{i}"):
+                self.assert_git_info(g, target)
+                self.assertEqual(g.git_dir, path.joinpath(".git"))
 
         # git-1 is an empty repo with no commits
         utc_now = datetime.datetime.now(datetime.timezone.utc)
-        path = self._DATA_ROOT.joinpath("git-1")
-        with time_machine.travel(utc_now, tick=False):
+        path = self._repo(1)
+        with base.swap_attr(git, "_utc_now", lambda: utc_now):
             g = git.fetch(path)
-        self.assertEqual(g.sha, "")
-        self.assertEqual(g.sha_abbrev, "")
-        self.assertEqual(g.branch, "master")
-        self.assertEqual(utc_now, g.date)
-        self.assertFalse(g.is_dirty)
-        self.assertEqual(g.distance, 0)
-        self.assertIsNone(g.tag)
+        self.assert_git_info(
+            g,
+            ("", "", "master", utc_now.timestamp(), False, 0, None),
+        )
         self.assertEqual(g.git_dir, path.joinpath(".git"))
 
         # Child folder will fail
-        path = self._DATA_ROOT.joinpath("git-1", "child")
+        path = self._repo(1).joinpath("child")
         self.assertRaises(RuntimeError, git.fetch, path)
 
-        # git-2 has a branch but is detached
-        path = self._DATA_ROOT.joinpath("git-2")
-        g = git.fetch(path)
-        self.assertEqual(g.sha, "b23ba426ab23f9bf525691e7550fc57afee48dd8")
-        self.assertEqual(g.sha_abbrev, "b23ba42")
-        self.assertEqual(g.branch, "feat/something")
-        self.assertEqual(
-            g.date,
-            datetime.datetime.fromisoformat("2022-07-18T11:55:17-07:00"),
-        )
-        self.assertTrue(g.is_dirty)
-        self.assertEqual(g.distance, 1)
-        self.assertEqual(g.tag, "v0.0.0")
-
-        # -dirty tag doesn't match REGEX
+        # git-2 -dirty tag doesn't match REGEX
         self.assertRaises(
             ValueError,
             git.fetch,
-            path,
-            describe_args=["--tags", "--dirty"],
-        )
-
-        # git-3 is detached from the master branch
-        # Has a change in the index but reverted in the working tree
-        path = self._DATA_ROOT.joinpath("git-3")
-        g = git.fetch(path, tag_prefix=None)
-        self.assertEqual(g.sha, "f70f3f504000d80d45922c213e3cc3dba9bc8e2c")
-        self.assertEqual(g.sha_abbrev, "f70f3f5")
-        self.assertEqual(g.branch, "master")
-        self.assertEqual(
-            g.date,
-            datetime.datetime.fromisoformat("2022-07-18T12:06:25-07:00"),
+            self._repo(2),
+            describe_args=("--tags", "--dirty"),
         )
-        self.assertFalse(g.is_dirty)
-        self.assertEqual(g.distance, 1)
-        self.assertEqual(g.tag, "0.0.0")
-
-        # git-4 has no branches but is detached
-        # Has a change in the index
-        path = self._DATA_ROOT.joinpath("git-4")
-        g = git.fetch(path)
-        self.assertEqual(g.sha, "f70f3f504000d80d45922c213e3cc3dba9bc8e2c")
-        self.assertEqual(g.sha_abbrev, "f70f3f5")
-        self.assertIsNone(g.branch)
-        self.assertEqual(
-            g.date,
-            datetime.datetime.fromisoformat("2022-07-18T12:06:25-07:00"),
-        )
-        self.assertTrue(g.is_dirty)
-        self.assertEqual(g.distance, 2)
-        self.assertIsNone(g.tag)
 
         # git-5 is detached from the main branch
         # Has a change in the index but reverted in the working tree
-        path = self._DATA_ROOT.joinpath("git-5")
-        start = time.perf_counter()
-        g = git.fetch(path, tag_prefix=None)
-        elapsed_slow = time.perf_counter() - start
-        self.assertEqual(g.sha, "f70f3f504000d80d45922c213e3cc3dba9bc8e2c")
-        self.assertEqual(g.sha_abbrev, "f70f3f5")
-        self.assertEqual(g.branch, "main")
-        self.assertEqual(
-            g.date,
-            datetime.datetime.fromisoformat("2022-07-18T12:06:25-07:00"),
+        path = self._repo(5)
+        with self._count_runs() as mock_run:
+            g = git.fetch(path, tag_prefix=None)
+        n_calls_slow = mock_run.call_count
+        target = (
+            "f70f3f504000d80d45922c213e3cc3dba9bc8e2c",
+            "f70f3f5",
+            "main",
+            _TS_GIT_3_4_5,
+            False,
+            1,
+            "0.0.0",
         )
-        self.assertFalse(g.is_dirty)
-        self.assertEqual(g.distance, 1)
-        self.assertEqual(g.tag, "0.0.0")
+        self.assert_git_info(g, target)
 
         d = g.asdict()
-        start = time.perf_counter()
-        g = git.fetch(path, tag_prefix=None, cache=d)
-        elapsed_cached = time.perf_counter() - start
-        self.assertEqual(g.sha, "f70f3f504000d80d45922c213e3cc3dba9bc8e2c")
-        self.assertEqual(g.sha_abbrev, "f70f3f5")
-        self.assertEqual(g.branch, "main")
-        self.assertEqual(
-            g.date,
-            datetime.datetime.fromisoformat("2022-07-18T12:06:25-07:00"),
-        )
-        self.assertFalse(g.is_dirty)
-        self.assertEqual(g.distance, 1)
-        self.assertEqual(g.tag, "0.0.0")
+        with self._count_runs() as mock_run:
+            g = git.fetch(path, tag_prefix=None, cache=d)
+        n_calls_cached = mock_run.call_count
+        self.assert_git_info(g, target)
 
-        self.log_speed(elapsed_slow, elapsed_cached)
-        self.assertGreater(elapsed_slow, elapsed_cached)
+        # Timing is too noisy to assert, the cache hit skips git commands instead
+        self.assertLess(n_calls_cached, n_calls_slow)
 
         # This won't use the partial cache
         d.pop("branch")
-        g = git.fetch(path, tag_prefix=None, cache=d)
-        self.assertEqual(g.sha, "f70f3f504000d80d45922c213e3cc3dba9bc8e2c")
-        self.assertEqual(g.sha_abbrev, "f70f3f5")
-        self.assertEqual(g.branch, "main")
-        self.assertEqual(
-            g.date,
-            datetime.datetime.fromisoformat("2022-07-18T12:06:25-07:00"),
-        )
-        self.assertFalse(g.is_dirty)
-        self.assertEqual(g.distance, 1)
-        self.assertEqual(g.tag, "0.0.0")
+        with self._count_runs() as mock_run:
+            g = git.fetch(path, tag_prefix=None, cache=d)
+        self.assert_git_info(g, target)
+        self.assertEqual(mock_run.call_count, n_calls_slow)
 
         # git-7 is a standard repo
         # But the cache was updated before v0.1.0 tag was added
         # Expect to rerun to get new tag name
-        path = self._DATA_ROOT.joinpath("git-7")
-        g = git.fetch(path=path)
-        d = g.asdict()
+        path = self._repo(7)
+        d = base.fetch(path).asdict()
         d["tag"] = "v0.0.0"
         d["distance"] = 1
 
         g = git.fetch(path, cache=d)
-        self.assertEqual(g.sha, "2200dfa76743325303418980c363826ccfd7acbd")
-        self.assertEqual(g.sha_abbrev, "2200dfa")
-        self.assertEqual(g.branch, "master")
-        self.assertEqual(
-            g.date,
-            datetime.datetime.fromisoformat("2023-08-23T12:53:05-07:00"),
+        self.assert_git_info(
+            g,
+            (
+                "2200dfa76743325303418980c363826ccfd7acbd",
+                "2200dfa",
+                "master",
+                _TS_GIT_7,
+                False,
+                0,
+                "v0.1.0",
+            ),
         )
-        self.assertFalse(g.is_dirty)
-        self.assertEqual(g.distance, 0)
-        self.assertEqual(g.tag, "v0.1.0")
 
     def test_dict(self) -> None:
-        major = self.random_int(0, 100)
-        minor = self.random_int(0, 100)
-        patch = self.random_int(0, 100)
-        sha = self.random_sha()
-        target = {
-            "tag": f"v{major}.{minor}.{patch}-rc1",
-            "tag_prefix": "v",
-            "sha": sha,
-            "sha_abbrev": sha[:7],
-            "branch": "master",
-            "date": datetime.datetime.now(datetime.timezone.utc),
-            "dirty": False,
-            "distance": self.random_int(0, 100),
-            "pretty_str": f"v{major}.{minor}.{patch}-rc1",
-            "git_dir": "something",
-        }
+        target = _DICT_TARGET
         g = git.GitVer(**target)
         d = g.asdict(include_git_dir=True)
         self.assertDictEqual(d, target)
@@ -228,15 +281,17 @@ class TestGit(base.TestBase):
         d = g.asdict(include_git_dir=False)
         self.assertIsNone(d["git_dir"])
 
-        d["date"] = d["date"].isoformat()
+        d["date"] = _DICT_DATE_ISO
         self.assertEqual(g, git.GitVer(**d))
 
         d = g.asdict(isoformat_date=True)
+        self.assertEqual(d["date"], _DICT_DATE_ISO)
         self.assertEqual(g, git.GitVer(**d))
 
+    @base.slow
     def test_build_semver(self) -> None:
         # git-6 is tagged as a RC and is dirty
-        path = self._DATA_ROOT.joinpath("git-6")
+        path = self._repo(6)
         g = git.fetch(
             path=path,
             tag_prefix="ver",
@@ -247,12 +302,9 @@ class TestGit(base.TestBase):
             date_in_pre=True,
         )
         d = g.asdict()
-        sha = "ea4d6f6162f033dd6a8056498def4d42980a531f"
-        sha_abbrev = sha[:7]
 
         s = str(g)
-        target = f"0.0.0-rc1.p0.dirty.g{sha}.g{sha_abbrev}.20220719T185017Z"
-        self.assertEqual(s, target)
+        self.assertEqual(s, _SEMVER_GIT_6_PRE)
 
         g = git.GitVer(
             dirty_in_pre=False,
@@ -263,8 +315,7 @@ class TestGit(base.TestBase):
             **d,
         )
         s = str(g)
-        target = f"0.0.0-rc1+p0.dirty.g{sha}.g{sha_abbrev}.20220719T185017Z"
-        self.assertEqual(s, target)
+        self.assertEqual(s, _SEMVER_GIT_6_BUILD)
 
         g = git.GitVer(
             dirty_in_pre=None,
@@ -278,10 +329,40 @@ class TestGit(base.TestBase):
         target = "0.0.0-rc1"
         self.assertEqual(s, target)
 
+    @base.slow
+    def test_fetch_cache_speed(self) -> None:
+        # Benchmark only, unmocked so the timing is of real git commands
+        path = self._repo(5)
+        start = time.perf_counter()
+        d = git.fetch(path, tag_prefix=None).asdict()
+        elapsed_slow = time.perf_counter() - start
+
+        start = time.perf_counter()
+        git.fetch(path, tag_prefix=None, cache=d)
+        elapsed_cached = time.perf_counter() - start
+
+        self.log_speed(elapsed_slow, elapsed_cached)
+
+    def assert_str_funcs(self, d: dict, targets: dict) -> None:
+        """Assert the output of string functions, directly and as pretty_str.
+
+        Args:
+            d: GitVer.asdict() to build the GitVer from
+            targets: {str_func: expected output}
+        """
+        g = git.GitVer(**d)
+        for func, target in targets.items():
+            with self.subTest(func=func.__name__):
+                self.assertEqual(func(g), target)
+                # GitVer calls a callable pretty_str once and str returns it
+                g_pretty = git.GitVer(**{**d, "pretty_str": func})
+                self.assertEqual(str(g_pretty), target)
+
+    @base.slow
     def test_str(self) -> None:
         # git-0 has a branch and is dirty
-        path = self._DATA_ROOT.joinpath("git-0")
-        g = git.fetch(path=path)
+        path = self._repo(0)
+        g = base.fetch(path)
         s = str(g)
         target = "1.2.3-rc1.p0.dirty.gdd0ae6e+20220718T180126Z"
         self.assertEqual(s, target)
@@ -292,64 +373,43 @@ class TestGit(base.TestBase):
         target = f"<witch_ver.git.GitVer '{s}'>"
         self.assertEqual(repr(g), target)
 
-        d["pretty_str"] = git.str_func_pep440
-        s = str(git.GitVer(**d))
-        target = "1.2.3-rc1+0.gdd0ae6e.dirty"
-        self.assertEqual(s, target)
-
-        d["pretty_str"] = git.str_func_git_describe
-        s = str(git.GitVer(**d))
-        target = "v1.2.3-rc1-dirty"
-        self.assertEqual(s, target)
-
-        d["pretty_str"] = git.str_func_git_describe_long
-        s = str(git.GitVer(**d))
-        target = "v1.2.3-rc1-0-gdd0ae6e-dirty"
-        self.assertEqual(s, target)
+        targets = {
+            git.str_func_pep440: "1.2.3-rc1+0.gdd0ae6e.dirty",
+            git.str_func_git_describe: "v1.2.3-rc1-dirty",
+            git.str_func_git_describe_long: "v1.2.3-rc1-0-gdd0ae6e-dirty",
+        }
+        self.assert_str_funcs(d, targets)
 
         # Fake being not dirty
         d["dirty"] = False
-        d["pretty_str"] = git.str_func_pep440
-        s = str(git.GitVer(**d))
-        target = "1.2.3-rc1"
-        self.assertEqual(s, target)
-
-        d["pretty_str"] = git.str_func_git_describe
-        s = str(git.GitVer(**d))
-        target = "v1.2.3-rc1"
-        self.assertEqual(s, target)
+        targets = {
+            git.str_func_pep440: "1.2.3-rc1",
+            git.str_func_git_describe: "v1.2.3-rc1",
+        }
+        self.assert_str_funcs(d, targets)
 
         # Remove tag_prefix from tag
         d["tag"] = d["tag"][1:]
-        d["pretty_str"] = git.str_func_pep440
-        s = str(git.GitVer(**d))
-        target = "1.2.3-rc1"
-        self.assertEqual(s, target)
+        self.assert_str_funcs(d, {git.str_func_pep440: "1.2.3-rc1"})
 
         # git-1 is an empty repo with no commits
-        path = self._DATA_ROOT.joinpath("git-1")
+        path = self._repo(1)
         g = git.fetch(path=path, custom_str_func=git.str_func_pep440)
         s = str(g)
         target = "0+untagged"
         self.assertEqual(s, target)
 
         d = g.asdict()
-
-        d["pretty_str"] = git.str_func_git_describe
-        s = str(git.GitVer(**d))
-        target = "v0.0.0-untagged-0-g"
-        self.assertEqual(s, target)
+        self.assert_str_funcs(d, {git.str_func_git_describe: "v0.0.0-untagged-0-g"})
 
         d["tag_prefix"] = ""
-        d["pretty_str"] = git.str_func_git_describe_long
-        s = str(git.GitVer(**d))
-        target = "0.0.0-untagged-0-g"
-        self.assertEqual(s, target)
+        targets = {git.str_func_git_describe_long: "0.0.0-untagged-0-g"}
+        self.assert_str_funcs(d, targets)
 
         # git-4 has no branches but is detached
         # Has a change in the index
-        path = self._DATA_ROOT.joinpath("git-4")
-        g = git.fetch(path=path)
+        path = self._repo(4)
+        g = base.fetch(path)
         s = str(g)
         target = "0.0.0-untagged.p2.dirty.gf70f3f5+20220718T190625Z"
         self.assertEqual(s, target)
@@ -357,25 +417,13 @@ class TestGit(base.TestBase):
         self.assertEqual(s, target)
 
         d = g.asdict()
-
-        d["pretty_str"] = git.str_func_pep440
-        s = str(git.GitVer(**d))
-        target = "0+untagged.2.gf70f3f5.dirty"
-        self.assertEqual(s, target)
-
-        d["pretty_str"] = git.str_func_git_describe
-        s = str(git.GitVer(**d))
-        target = "f70f3f5-dirty"
-        self.assertEqual(s, target)
-
-        d["pretty_str"] = git.str_func_git_describe_long
-        s = str(git.GitVer(**d))
-        target = "f70f3f5-dirty"
-        self.assertEqual(s, target)
+        targets = {
+            git.str_func_pep440: "0+untagged.2.gf70f3f5.dirty",
+            git.str_func_git_describe: "f70f3f5-dirty",
+            git.str_func_git_describe_long: "f70f3f5-dirty",
+        }
+        self.assert_str_funcs(d, targets)
 
         # Fake being not dirty
         d["dirty"] = False
-        d["pretty_str"] = git.str_func_pep440
-        s = str(git.GitVer(**d))
-        target = "0+untagged.2.gf70f3f5"
-        self.assertEqual(s, target)
+        self.assert_str_funcs(d, {git.str_func_pep440: "0+untagged.2.gf70f3f5"})
@@ -1,37 +1,164 @@
 from __future__ import annotations
 
+import contextlib
+import filecmp
 import io
-import os
-import pathlib
 import re
-import shutil
 import sys
-import textwrap
-import zipfile
+import typing as t
 from pathlib import Path
-from unittest import mock
+from typing import TYPE_CHECKING
 
 from tests import base
 from witch_ver import git, integration
 
+if TYPE_CHECKING:
+    from types import ModuleType
+
+# Files use_witch_ver writes in place, the rest of a package fixture is only read
+_WRITABLE = ("hello/__init__.py", "hello/version.py")
+
+# Independent of integration.REGEX_VERSION_DICT, so a wrong pattern there can't
+# also produce a matching expected version.py
+_REGEX_VERSION_DICT = re.compile(r"version_dict = {.*?}", re.S)
+
+# Expected outputs of each package, written unindented so no dedent is needed
+_VERSION_DICT_PACKAGE_1 = """\
+version_dict = {
+    "tag": "v0.0.0",
+    "tag_prefix": "v",
+    "sha": "d78b554b4fc9ad5bdf844a4702c6a06d7ae5fdcb",
+    "sha_abbrev": "d78b554",
+    "branch": "master",
+    "date": "2022-07-29T13:08:23-07:00",
+    "dirty": False,
+    "distance": 1,
+    "pretty_str": "0.0.0+1.gd78b554",
+    "git_dir": None,
+}"""
+_INIT_PACKAGE_1 = '''\
+"""Hello-world
+"""
+
+from hello.version import __version__
+
+from hello.world import MSG
+'''
+
+_VERSION_DICT_PACKAGE_2 = """\
+version_dict = {
+    "tag": "v0.0.0",
+    "tag_prefix": "v",
+    "sha": "93d84de0a95250fbacac83671f6f1ad7fb236742",
+    "sha_abbrev": "93d84de",
+    "branch": "master",
+    "date": "2022-07-29T13:46:13-07:00",
+    "dirty": False,
+    "distance": 2,
+    "pretty_str": "0.0.0+2.g93d84de",
+    "git_dir": None,
+}"""
+_INIT_PACKAGE_2 = """\
+# Hello-world module is missing PEP0257 docstring
+
+from hello.world import MSG
+
+from hello.version import __version__
+"""
+
+
+def _fetch_outside_git(
+    *args,  # noqa: ARG001, ANN002
+    **kwargs,  # noqa: ARG001, ANN003
+) -> None:
+    # git.fetch as if the package was no longer in a git repository
+    raise RuntimeError
+
 
 class TestIntegration(base.TestBase):
     @classmethod
     def setUpClass(cls) -> None:
         super().setUpClass()
 
-        # Can't commit a git repo to this repo
-        # Test repos are zipped, extract before testing
-        for i in range(3):
-            path = cls._DATA_ROOT.joinpath(f"package-{i + 1}")
-            if not path.exists():
-                z = path.with_suffix(".zip")
-                with zipfile.ZipFile(z, "r") as z_file:
-                    z_file.extractall(path)
+        # Template of every generated version.py
+        path = Path(integration.__file__).with_name("version_hook.py")
+        with path.open(encoding="utf-8") as file:
+            cls._VERSION_HOOK = file.read()
+
+    @classmethod
+    def _package(cls, i: int) -> Path:
+        """Get the path to a fixture package, extracting it on first use.
+
+        Args:
+            i: Index of the package-{i} repo
+
+        Returns:
+            Path to the extracted package
+        """
+        path = cls._DATA_ROOT.joinpath(f"package-{i}")
+        base.extract_zips((path,))
+        return path
+
+    @contextlib.contextmanager
+    def _run_package(self, i: int) -> t.Iterator[t.Tuple[ModuleType, Path]]:
+        """Clone a fixture package and run from inside it as setup.py --version.
+
+        Args:
+            i: Index of the package-{i} repo
+
+        Yields:
+            (imported setup.py of the clone, path to the clone)
+        """
+        path_test = self._test_dir.joinpath("package")
+        base.clone_tree(self._package(i), path_test, _WRITABLE)
+
+        setup = self.import_file(path_test.joinpath("setup.py"))
+
+        # Run from inside the package
+        argv = ["setup.py", "--version"]
+        with base.chdir(path_test), base.swap_attr(sys, "argv", argv):
+            yield setup, path_test
+
+    def _target_version(self, version_dict: str) -> str:
+        """Get the expected contents of a generated version.py.
+
+        Args:
+            version_dict: version_dict = {...} source
+
+        Returns:
+            version_hook.py with its version_dict replaced
+        """
+        return _REGEX_VERSION_DICT.sub(
+            version_dict,
+            self._VERSION_HOOK,
+            count=1,
+        )
+
+    def assert_package_files(
+        self,
+        path_test: Path,
+        target_ver: str,
+        target_init: str,
+    ) -> None:
+        """Assert the version.py and __init__.py written by use_witch_ver.
+
+        Args:
+            path_test: Path to the package clone
+            target_ver: Expected contents of hello/version.py
+            target_init: Expected contents of hello/__init__.py
+        """
+        self.maxDiff = None
+        path = path_test.joinpath("hello", "version.py")
+        with path.open(encoding="utf-8") as file:
+            self.assertEqual(file.read(), target_ver)
+
+        path = path_test.joinpath("hello", "__init__.py")
+        with path.open(encoding="utf-8") as file:
+            self.assertEqual(file.read(), target_init)
 
     def test_write_matching_newline(self) -> None:
-        path = self._TEST_ROOT.joinpath("version.txt")
-        contents = "\n".join(self.random_string() for _ in range(10))
+        path = self._test_dir.joinpath("version.txt")
+        contents = "\n".join(base.FIXED_LINES[:10])
 
         def check_file(*_, crlf: bool) -> None:
             """Check if contents match and line ending is proper.
@@ -47,60 +174,36 @@ class TestIntegration(base.TestBase):
                 is_crlf = b"\r\n" in file.read()
                 self.assertEqual(is_crlf, crlf)
 
-        original_open = io.open
-
-        calls = []
-
-        def mock_open(fname: str, *args, **kwargs) -> object:  # noqa: ANN002, ANN003
-            calls.append({"file": fname, "args": args, "kwargs": kwargs})
-            return original_open(fname, *args, **kwargs)
-
-        try:
-            io.open = mock_open
-
-            # For 3.10 pathlib used an accessor model, mock that too
-            if self.is_py_3_10:
-                pathlib._normal_accessor.open = mock_open  # type: ignore[attr-defined] # noqa: SLF001
-
-            # File does not exist yet
-            calls.clear()
+        # File does not exist yet
+        with base.record_open(path) as modes:
             integration._write_matching_newline(path, contents)  # noqa: SLF001
-            self.assertEqual(len(calls), 1)
-            self.assertEqual(calls[0]["args"][0], "wb")
-            check_file(crlf=False)
+        self.assertEqual(modes, ["wb"])
+        check_file(crlf=False)
 
-            # File does exist, no modifications to take place
-            calls.clear()
+        # File does exist, no modifications to take place
+        with base.record_open(path) as modes:
             integration._write_matching_newline(path, contents)  # noqa: SLF001
-            self.assertEqual(len(calls), 1)
-            self.assertEqual(calls[0]["args"][0], "rb")
-            check_file(crlf=False)
+        self.assertEqual(modes, ["rb"])
+        check_file(crlf=False)
 
-            with path.open("wb") as file:
-                contents_b = contents.encode().replace(b"\n", b"\r\n")
-                file.write(contents_b)
+        with path.open("wb") as file:
+            contents_b = contents.encode().replace(b"\n", b"\r\n")
+            file.write(contents_b)
 
-            # File does exist as CRLF, no modifications to take place
-            calls.clear()
+        # File does exist as CRLF, no modifications to take place
+        with base.record_open(path) as modes:
             integration._write_matching_newline(path, contents)  # noqa: SLF001
-            self.assertEqual(len(calls), 1)
-            self.assertEqual(calls[0]["args"][0], "rb")
-            check_file(crlf=True)
+        self.assertEqual(modes, ["rb"])
+        check_file(crlf=True)
 
-            # Modify contents
-            contents += self.random_string()
+        # Modify contents
+        contents += base.FIXED_LINES[10]
 
-            # File does exist as CRLF
-            calls.clear()
+        # File does exist as CRLF
+        with base.record_open(path) as modes:
             integration._write_matching_newline(path, contents)  # noqa: SLF001
-            self.assertEqual(len(calls), 2)
-            self.assertEqual(calls[0]["args"][0], "rb")
-            self.assertEqual(calls[1]["args"][0], "wb")
-            check_file(crlf=True)
-        finally:
-            io.open = original_open
-            if self.is_py_3_10:
-                pathlib._normal_accessor.open = original_open  # type: ignore[attr-defined] # noqa: SLF001
+        self.assertEqual(modes, ["rb", "wb"])
+        check_file(crlf=True)
 
     def test_use_witch_ver(self) -> None:
         # use_witch_ver is False
@@ -133,208 +236,62 @@ class TestIntegration(base.TestBase):
         # use_witch_ver = not a boolean or dictionary
         self.assertRaises(TypeError, integration.use_witch_ver, None, None, "version")
 
+    @base.slow
     def test_use_witch_ver_package1(self) -> None:
-        path_package = self._DATA_ROOT.joinpath("package-1")
-        path_test = self._TEST_ROOT.joinpath("package")
-        shutil.copytree(path_package, path_test)
-
-        setup = self.import_file(path_test.joinpath("setup.py"))
-
-        # Change folder to package
-        original_cwd = Path.cwd()
-        original_argv = sys.argv
-        try:
-            os.chdir(path_test)
-            sys.argv = ["setup.py", "--version"]
-
-            path_version = path_test.joinpath("hello", "version.py")
-
-            # Prepare the expected output for version.py
-            path_version_hook = Path(integration.__file__).with_name(
-                "version_hook.py",
-            )
-            with path_version_hook.open(encoding="utf-8") as file:
-                target_ver = file.read()
-            target_version_dict = textwrap.dedent(
-                """\
-                version_dict = {
-                    "tag": "v0.0.0",
-                    "tag_prefix": "v",
-                    "sha": "d78b554b4fc9ad5bdf844a4702c6a06d7ae5fdcb",
-                    "sha_abbrev": "d78b554",
-                    "branch": "master",
-                    "date": "2022-07-29T13:08:23-07:00",
-                    "dirty": False,
-                    "distance": 1,
-                    "pretty_str": "0.0.0+1.gd78b554",
-                    "git_dir": None,
-                }""",
-            )
-            target_ver = re.sub(
-                r"version_dict = {.*?}",
-                target_version_dict,
-                target_ver,
-                count=1,
-                flags=re.S,
-            )
-
-            # Prepare the expected output for __init__.py
-            path_init = path_test.joinpath("hello", "__init__.py")
-            target_init = textwrap.dedent(
-                '''\
-                """Hello-world
-                """
-
-                from hello.version import __version__
-
-                from hello.world import MSG
-                ''',
-            )
-
-            with mock.patch("sys.stdout", new=io.StringIO()) as fake_stdout:
+        with self._run_package(1) as (setup, path_test):
+            with contextlib.redirect_stdout(io.StringIO()) as fake_stdout:
                 setup.setup()
 
             # Validate setup.py got proper version
             self.assertEqual(fake_stdout.getvalue().strip(), "0.0.0+1.gd78b554")
 
-            self.maxDiff = None
-            with path_version.open(encoding="utf-8") as file:
-                self.assertEqual(file.read(), target_ver)
-
-            with path_init.open(encoding="utf-8") as file:
-                self.assertEqual(file.read(), target_init)
-
-        finally:
-            os.chdir(original_cwd)
-            sys.argv = original_argv
+            target_ver = self._target_version(_VERSION_DICT_PACKAGE_1)
+            self.assert_package_files(path_test, target_ver, _INIT_PACKAGE_1)
 
+    @base.slow
     def test_use_witch_ver_package2(self) -> None:
-        path_package = self._DATA_ROOT.joinpath("package-2")
-        path_test = self._TEST_ROOT.joinpath("package")
-        shutil.copytree(path_package, path_test)
-
-        setup = self.import_file(path_test.joinpath("setup.py"))
-
-        # Change folder to package
-        original_cwd = Path.cwd()
-        original_argv = sys.argv
-        try:
-            os.chdir(path_test)
-            sys.argv = ["setup.py", "--version"]
-
-            path_version = path_test.joinpath("hello", "version.py")
-
-            # Prepare the expected output for version.py
-            path_version_hook = Path(integration.__file__).with_name(
-                "version_hook.py",
-            )
-            with path_version_hook.open(encoding="utf-8") as file:
-                target_ver = file.read()
-            target_version_dict = textwrap.dedent(
-                """\
-                version_dict = {
-                    "tag": "v0.0.0",
-                    "tag_prefix": "v",
-                    "sha": "93d84de0a95250fbacac83671f6f1ad7fb236742",
-                    "sha_abbrev": "93d84de",
-                    "branch": "master",
-                    "date": "2022-07-29T13:46:13-07:00",
-                    "dirty": False,
-                    "distance": 2,
-                    "pretty_str": "0.0.0+2.g93d84de",
-                    "git_dir": None,
-                }""",
-            )
-            target_ver = re.sub(
-                r"version_dict = {.*?}",
-                target_version_dict,
-                target_ver,
-                count=1,
-                flags=re.S,
-            )
-
-            # Prepare the expected output for __init__.py
-            path_init = path_test.joinpath("hello", "__init__.py")
-            target_init = textwrap.dedent(
-                """\
-                # Hello-world module is missing PEP0257 docstring
-
-                from hello.world import MSG
-
-                from hello.version import __version__
-                """,
-            )
-
-            with mock.patch("sys.stdout", new=io.StringIO()) as fake_stdout:
+        with self._run_package(2) as (setup, path_test):
+            with contextlib.redirect_stdout(io.StringIO()) as fake_stdout:
                 setup.setup()
 
             # Validate setup.py got proper version
             self.assertEqual(fake_stdout.getvalue().strip(), "0.0.0+2.g93d84de")
 
-            self.maxDiff = None
-            with path_version.open(encoding="utf-8") as file:
-                self.assertEqual(file.read(), target_ver)
-
-            with path_init.open(encoding="utf-8") as file:
-                self.assertEqual(file.read(), target_init)
-
-            # Mock outside of a git repository
-
-            def mock_fetch(
-                *args,  # noqa: ARG001, ANN002
-                **kwargs,  # noqa: ARG001, ANN003
-            ) -> None:
-                raise RuntimeError
-
-            original_fetch = git.fetch
-            try:
-                git.fetch = mock_fetch
+            target_ver = self._target_version(_VERSION_DICT_PACKAGE_2)
+            self.assert_package_files(path_test, target_ver, _INIT_PACKAGE_2)
+
+    def test_use_witch_ver_package2_no_git_with_cache(self) -> None:
+        with self._run_package(2) as (setup, path_test):
+            # A previous run left version.py behind
+            target_ver = self._target_version(_VERSION_DICT_PACKAGE_2)
+            path = path_test.joinpath("hello", "version.py")
+            with path.open("w", encoding="utf-8") as file:
+                file.write(target_ver)
+
+            # Succeeds since version.py exists
+            fake_stdout = io.StringIO()
+            outside_git = base.swap_attr(git, "fetch", _fetch_outside_git)
+            with outside_git, contextlib.redirect_stdout(fake_stdout):
+                setup.setup()
+            self.assertEqual(fake_stdout.getvalue().strip(), "0.0.0+2.g93d84de")
 
-                # Succeeds since version.py exists
-                with mock.patch("sys.stdout", new=io.StringIO()) as fake_stdout:
-                    setup.setup()
-                self.assertEqual(fake_stdout.getvalue().strip(), "0.0.0+2.g93d84de")
+            self.assert_package_files(path_test, target_ver, _INIT_PACKAGE_2)
 
-                # Fails since version.py does not exist
-                path_version.unlink()
-                with mock.patch("sys.stdout", new=io.StringIO()) as fake_stdout:
-                    self.assertRaises(RuntimeError, setup.setup)
-                self.assertEqual(fake_stdout.getvalue().strip(), "")
-            finally:
-                git.fetch = original_fetch
+    def test_use_witch_ver_package2_no_git_no_cache(self) -> None:
+        with self._run_package(2) as (setup, path_test):
+            self.assertFalse(path_test.joinpath("hello", "version.py").exists())
 
-        finally:
-            os.chdir(original_cwd)
-            sys.argv = original_argv
+            # Fails since version.py does not exist
+            fake_stdout = io.StringIO()
+            outside_git = base.swap_attr(git, "fetch", _fetch_outside_git)
+            with outside_git, contextlib.redirect_stdout(fake_stdout):
+                self.assertRaises(RuntimeError, setup.setup)
+            self.assertEqual(fake_stdout.getvalue().strip(), "")
 
+    @base.slow
     def test_use_witch_ver_package3(self) -> None:
-        path_package = self._DATA_ROOT.joinpath("package-3")
-        path_test = self._TEST_ROOT.joinpath("package")
-        shutil.copytree(path_package, path_test)
-
-        setup = self.import_file(path_test.joinpath("setup.py"))
-
-        # Change folder to package
-        original_cwd = Path.cwd()
-        original_argv = sys.argv
-        try:
-            os.chdir(path_test)
-            sys.argv = ["setup.py", "--version"]
-
-            path_version = path_test.joinpath("hello", "version.py")
-
-            # Prepare the expected output for version.py
-            # Already exists so load that file
-            with path_version.open(encoding="utf-8") as file:
-                target_ver = file.read()
-
-            # Prepare the expected output for __init__.py
-            # Already installed so no changes
-            path_init = path_test.joinpath("hello", "__init__.py")
-            with path_init.open(encoding="utf-8") as file:
-                target_init = file.read()
-
-            with mock.patch("sys.stdout", new=io.StringIO()) as fake_stdout:
+        with self._run_package(3) as (setup, path_test):
+            with contextlib.redirect_stdout(io.StringIO()) as fake_stdout:
                 setup.setup()
 
             # Validate setup.py got proper version
@@ -343,13 +300,15 @@ class TestIntegration(base.TestBase):
                 "0.0.0+4.29c921b55529e5a6ba963bcbcaf2f7e1d9f9efe6",
             )
 
-            self.maxDiff = None
-            with path_version.open(encoding="utf-8") as file:
-                self.assertEqual(target_ver, file.read())
-
-            with path_init.open(encoding="utf-8") as file:
-                self.assertEqual(target_init, file.read())
-
-        finally:
-            os.chdir(original_cwd)
-            sys.argv = original_argv
+            # version.py already exists and __init__.py is already installed so
+            # both are unchanged from the fixture
+            path_package = self._package(3)
+            for name in _WRITABLE:
+                with self.subTest(file=name):
+                    self.assertTrue(
+                        filecmp.cmp(
+                            path_package.joinpath(name),
+                            path_test.joinpath(name),
+                            shallow=False,
+                        ),
+                    )
@@ -11,43 +11,52 @@ if TYPE_CHECKING:
     import os
 
 
+class _MockData:
+    bad_cmd = "_"
+
+    def __init__(self) -> None:
+        # Fresh per test so nothing recorded leaks between tests
+        self.cmd_called: t.Union[t.List[str], None] = None
+        self.cwd_called: t.Union[str, bytes, os.PathLike, None] = None
+        self.stdout_out: str = ""
+        self.returncode_out: int = 0
+
+    def run(
+        self,
+        cmd: t.List[str],
+        cwd: t.Union[str, bytes, os.PathLike, None] = None,
+        **_,
+    ) -> subprocess.CompletedProcess:
+        # Only record, the test asserts on what was recorded after runner.run returns
+        self.cmd_called = cmd
+        self.cwd_called = cwd
+
+        if cmd[0] == self.bad_cmd:
+            raise OSError
+
+        return subprocess.CompletedProcess(
+            cmd,
+            self.returncode_out,
+            self.stdout_out.encode(),
+            b"",
+        )
+
+
 class TestRunner(base.TestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._mock = _MockData()
+
+    def assert_cmd_called(self, target: t.List[str]) -> None:
+        cmd = self._mock.cmd_called
+        self.assertIsInstance(cmd, list)
+        self.assertTrue(all(isinstance(c, str) for c in cmd))  # type: ignore[union-attr]
+        self.assertEqual(cmd, target)
+
     def test_run(self) -> None:
-        bad_cmd = "_"
-
-        class MockData:
-            cmd_called: t.Union[t.List[str], None] = None
-            cwd_called: t.Union[str, bytes, os.PathLike, None] = None
-            stdout_out: str = ""
-            returncode_out: int = 0
-
-        m = MockData()
-
-        def mock_run(
-            cmd: t.List[str],
-            cwd: t.Union[str, bytes, os.PathLike, None] = None,
-            **_,
-        ) -> subprocess.CompletedProcess:
-            m.cmd_called = cmd
-            m.cwd_called = cwd
-
-            self.assertIsInstance(cmd, list)
-            if cmd[0] == bad_cmd:
-                raise OSError
-            for c in cmd:
-                self.assertIsInstance(c, str)
-
-            return subprocess.CompletedProcess(
-                cmd,
-                m.returncode_out,
-                m.stdout_out.encode(),
-                b"",
-            )
-
-        original_run = runner.subprocess.run
-        try:
-            runner.subprocess.run = mock_run
+        m = self._mock
 
+        with base.swap_attr(runner.subprocess, "run", m.run):
             cmd = "echo"
             args = ["hello"]
             m.stdout_out = "hi"
@@ -57,19 +66,16 @@ class TestRunner(base.TestBase):
             self.assertEqual(stdout, m.stdout_out)
             self.assertEqual(returncode, m.returncode_out)
             self.assertIsNone(m.cwd_called)
-            self.assertEqual(m.cmd_called, [cmd, *args])
+            self.assert_cmd_called([cmd, *args])
 
-            cmd = bad_cmd
+            cmd = m.bad_cmd
             args = ["hello"]
             m.stdout_out = "hi"
             m.returncode_out = 0
 
-            stdout, returncode = runner.run(cmd, args, cwd=self._TEST_ROOT)
+            stdout, returncode = runner.run(cmd, args, cwd=self._test_dir)
 
-            self.assertEqual(stdout, f"Failed to run '{bad_cmd} {' '.join(args)}'")
+            self.assertEqual(stdout, f"Failed to run '{m.bad_cmd} {' '.join(args)}'")
             self.assertNotEqual(returncode, 0)
-            self.assertEqual(m.cwd_called, self._TEST_ROOT)
-            self.assertEqual(m.cmd_called, [cmd, *args])
-
-        finally:
-            runner.subprocess.run = original_run
+            self.assertEqual(m.cwd_called, self._test_dir)
+            self.assert_cmd_called([cmd, *args])
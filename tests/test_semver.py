@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import operator
 import string
 
 from tests import base
@@ -27,8 +28,7 @@ class TestSemVer(base.TestBase):
         s = f"{major}.{minor}"
         self.assertRaises(ValueError, semver.SemVer, string=s)
 
-        s = f"{major}.{minor}.{patch}"
-        v = semver.SemVer(string=s)
+        _, v = self.semver_fixture(major, minor, patch)
         self.assertEqual(v.major, major)
         self.assertEqual(v.minor, minor)
         self.assertEqual(v.patch, patch)
@@ -55,20 +55,32 @@ class TestSemVer(base.TestBase):
         self.assertEqual(v.prerelease, prerelease)
         self.assertEqual(v.build_list, [])
 
-        s = f"{major}.{minor}.{patch}-{prerelease}"
-        v = semver.SemVer(string=s)
+        _, v = self.semver_fixture(major, minor, patch, prerelease)
         self.assertEqual(v.major, major)
         self.assertEqual(v.minor, minor)
         self.assertEqual(v.patch, patch)
         self.assertEqual(v.prerelease, prerelease)
         self.assertEqual(v.build_list, [])
 
+        # Tags are interned, parsed and appended tags share one string
+        v_append = semver.SemVer(major=major, minor=minor, patch=patch)
+        # Join to append an equal but distinct string object
+        v_append.append_prerelease("".join(prerelease))
+        self.assertIs(v_append.prerelease_list[0], v.prerelease_list[0])
+
         s = f"{major}.{minor}.{patch}-"
         self.assertRaises(ValueError, semver.SemVer, string=s)
 
         s = f"{major}.{minor}.{patch}-01"
         self.assertRaises(ValueError, semver.SemVer, string=s)
 
+        s = f"{major}.{minor}.{patch}\n"
+        self.assertRaises(ValueError, semver.SemVer, string=s)
+
+        # Only ASCII digits, not other Unicode digits such as ARABIC-INDIC ONE
+        self.assertRaises(ValueError, semver.SemVer, string="1\u0661.0.0")
+        self.assertRaises(ValueError, semver.SemVer, string="1.0.0-1\u0661")
+
         self.assertRaises(
             ValueError,
             semver.SemVer,
@@ -85,6 +97,14 @@ class TestSemVer(base.TestBase):
             patch=patch,
             prerelease=[prerelease + "+"],
         )
+        self.assertRaises(
+            ValueError,
+            semver.SemVer,
+            major=major,
+            minor=minor,
+            patch=patch,
+            prerelease=prerelease + "\n",
+        )
 
         prerelease = [prerelease, "0", "RC1", "metadata-here-123"]
 
@@ -123,8 +143,7 @@ class TestSemVer(base.TestBase):
         self.assertEqual(v.prerelease_list, [])
         self.assertEqual(v.build, build)
 
-        s = f"{major}.{minor}.{patch}+{build}"
-        v = semver.SemVer(string=s)
+        _, v = self.semver_fixture(major, minor, patch, build=build)
         self.assertEqual(v.major, major)
         self.assertEqual(v.minor, minor)
         self.assertEqual(v.patch, patch)
@@ -190,6 +209,15 @@ class TestSemVer(base.TestBase):
         self.assertEqual(v.prerelease_list, prerelease)
         self.assertEqual(v.build_list, build)
 
+        # Lists are copies, modifying them does not change the version
+        v.prerelease_list.append("extra")
+        v.build_list.clear()
+        self.assertEqual(v.prerelease_list, prerelease)
+        self.assertEqual(v.build_list, build)
+
+        # Slotted, no per instance __dict__
+        self.assertFalse(hasattr(v, "__dict__"))
+
     def test_equality(self) -> None:
         major = self.random_int(0, 100)
         minor = self.random_int(0, 100)
@@ -205,39 +233,58 @@ class TestSemVer(base.TestBase):
             build=build,
         )
 
-        self.assertRaises(TypeError, v.__eq__, None)
+        # Other types defer to Python, == falls back to identity
+        self.assertIs(v.__eq__(None), NotImplemented)
+        self.assertNotEqual(v, None)
+        self.assertNotEqual(v, "not a version")
 
-        s = f"{major}.{minor}.{patch}-{prerelease}+{build}"
+        s, v_s = self.semver_fixture(major, minor, patch, prerelease, build)
 
         self.assertEqual(v, s)
         self.assertEqual(s, v)
-        self.assertEqual(v, semver.SemVer(s))
-
-        s = f"{major}.{minor}.{patch}-{prerelease}+{build}.extra"
-        self.assertNotEqual(v, semver.SemVer(s))
-
-        s = f"{major}.{minor}.{patch}-{prerelease}"
-        self.assertNotEqual(v, semver.SemVer(s))
-
-        s = f"{major}.{minor}.{patch}-{prerelease}.extra"
-        self.assertNotEqual(v, semver.SemVer(s))
-
-        s = f"{major}.{minor}.{patch}"
-        self.assertNotEqual(v, semver.SemVer(s))
-
-        s = f"{major}.{minor}.1{patch}"
-        self.assertNotEqual(v, semver.SemVer(s))
-
-        s = f"{major}.1{minor}.{patch}"
-        self.assertNotEqual(v, semver.SemVer(s))
-
-        s = f"1{major}.{minor}.{patch}"
-        self.assertNotEqual(v, semver.SemVer(s))
+        self.assertEqual(v, v_s)
+
+        # Hashes match where equal, usable as keys interchangeably with strings
+        self.assertEqual(hash(v), hash(s))
+        self.assertEqual(hash(v), hash(v_s))
+        self.assertIn(s, {v})
+        self.assertIn(v, {s})
+
+        # Non-canonical input hashes as its canonical string, and strings that
+        # would normalize to it are not equal, so equal objects hash equal
+        v_parts = semver.SemVer(major=str(major), minor=minor, patch=patch)
+        v_parts.append_prerelease(prerelease)
+        v_parts.append_build(build)
+        self.assertEqual(v_parts, s)
+        self.assertEqual(hash(v_parts), hash(s))
+        self.assertIn(s, {v_parts})
+        v_core = semver.SemVer(major=11, minor=0, patch=0)
+        self.assertNotEqual(v_core, "1\u0661.0.0")
+        self.assertNotIn("1\u0661.0.0", {v_core})
+
+        others = [
+            (major, minor, patch, prerelease, f"{build}.extra"),
+            (major, minor, patch, prerelease),
+            (major, minor, patch, f"{prerelease}.extra"),
+            (major, minor, patch),
+            (major, minor, patch + 1),
+            (major, minor + 1, patch),
+            (major + 1, minor, patch),
+        ]
+        for parts in others:
+            s, v_s = self.semver_fixture(*parts)
+            with self.subTest(other=s):
+                self.assertNotEqual(v, v_s)
 
     def test_compare(self) -> None:
         v = semver.SemVer("2.1.1")
 
-        self.assertRaises(TypeError, v.__gt__, None)
+        # Other types defer to Python, which raises for ordering
+        self.assertIs(v.__gt__(None), NotImplemented)
+        self.assertRaises(TypeError, operator.gt, v, None)
+        self.assertRaises(TypeError, operator.ge, v, None)
+        self.assertRaises(TypeError, operator.lt, v, None)
+        self.assertRaises(TypeError, operator.le, v, None)
 
         self.assertGreater(v, semver.SemVer("1.0.0"))
         self.assertGreater(v, "1.0.0")
@@ -247,6 +294,8 @@ class TestSemVer(base.TestBase):
 
         self.assertLessEqual(v, str(v))
         self.assertGreaterEqual(v, str(v))
+        self.assertLessEqual(v, semver.SemVer(str(v)))
+        self.assertGreaterEqual(v, semver.SemVer(str(v)))
 
         v = semver.SemVer("2.1.1-beta.10")
         self.assertGreater(v, "2.1.1-alpha")
@@ -255,8 +304,33 @@ class TestSemVer(base.TestBase):
         self.assertLessEqual(v, "2.1.1-beta.extra")
         self.assertGreater(v, "2.1.1-beta.10.extra")
 
+        # Alphanumeric even though it starts with a digit
+        self.assertLess(v, "2.1.1-beta.0abc")
+
         self.assertLess(v, "2.1.1-beta.extra")
 
+        # Earlier parts decide, regardless of later ones
+        self.assertLess(semver.SemVer("1.5.0"), "2.0.0")
+        self.assertLess(semver.SemVer("2.0.5"), "2.1.0")
+        self.assertLess(semver.SemVer("1.0.0-2"), "1.0.0-10.a")
+        self.assertLess(semver.SemVer("1.0.0-1.b"), "1.0.0-2.a")
+        self.assertGreater(semver.SemVer("1.0.0"), "1.0.0-rc.1")
+
+        # Precedence is cached, prerelease mutations must refresh it
+        v = semver.SemVer("1.0.0-1")
+        self.assertLess(v, "1.0.0-2")
+        v.clear_prerelease()
+        v.append_prerelease("3")
+        self.assertGreater(v, "1.0.0-2")
+        v.clear_prerelease()
+        self.assertGreater(v, "1.0.0-3")
+
+        # Build metadata has no precedence
+        v = semver.SemVer("1.0.0+a")
+        self.assertLessEqual(v, "1.0.0+b")
+        self.assertGreaterEqual(v, "1.0.0+b")
+        self.assertNotEqual(v, "1.0.0+b")
+
     def test_str(self) -> None:
         major = self.random_int(0, 100)
         minor = self.random_int(0, 100)
@@ -264,9 +338,7 @@ class TestSemVer(base.TestBase):
         prerelease = f"{self.random_sha()}.alpha"
         build = f"{self.random_sha()}.2022"
 
-        s = f"{major}.{minor}.{patch}-{prerelease}+{build}"
-
-        v = semver.SemVer(s)
+        s, v = self.semver_fixture(major, minor, patch, prerelease, build)
 
         self.assertEqual(str(v), s)
 
@@ -280,18 +352,21 @@ class TestSemVer(base.TestBase):
         prerelease = f"{self.random_sha()}.alpha"
         build = f"{self.random_sha()}.2022"
 
-        s = f"{major}.{minor}.{patch}-{prerelease}+{build}"
-
-        v = semver.SemVer(s)
+        # str is cached, every mutation must refresh it
+        s, v = self.semver_fixture(major, minor, patch, prerelease, build)
+        self.assertEqual(str(v), s)
         v.bump_major()
         self.assertEqual(v.major, major + 1)
         self.assertEqual(v.minor, 0)
         self.assertEqual(v.patch, 0)
         self.assertEqual(v.prerelease_list, [])
         self.assertEqual(v.build_list, [])
+        self.assertEqual(str(v), f"{major + 1}.0.0")
 
         v.append_prerelease(prerelease)
+        self.assertEqual(str(v), f"{major + 1}.0.0-{prerelease}")
         v.append_build(build)
+        self.assertEqual(str(v), f"{major + 1}.0.0-{prerelease}+{build}")
 
         v.bump_patch()
         self.assertEqual(v.major, major + 1)
@@ -299,13 +374,36 @@ class TestSemVer(base.TestBase):
         self.assertEqual(v.patch, 1)
         self.assertEqual(v.prerelease_list, [])
         self.assertEqual(v.build_list, [])
+        self.assertEqual(str(v), f"{major + 1}.0.1")
 
         v.append_prerelease(prerelease)
         v.append_build(build)
 
+        # Invalid tags are rejected whole, nothing is appended
+        self.assertRaises(ValueError, v.append_prerelease, "rc.01")
+        self.assertRaises(ValueError, v.append_prerelease, "rc..1")
+        self.assertRaises(ValueError, v.append_build, "rc.+")
+        self.assertEqual(v.prerelease, prerelease)
+        self.assertEqual(v.build, build)
+
+        self.assertEqual(str(v), f"{major + 1}.0.1-{prerelease}+{build}")
+        v.clear_build()
+        self.assertEqual(v.build, "")
+        self.assertEqual(str(v), f"{major + 1}.0.1-{prerelease}")
+        v.append_build(build)
+
         v.bump_minor()
         self.assertEqual(v.major, major + 1)
         self.assertEqual(v.minor, 1)
         self.assertEqual(v.patch, 0)
         self.assertEqual(v.prerelease_list, [])
         self.assertEqual(v.build_list, [])
+        self.assertEqual(v.prerelease, "")
+        self.assertEqual(v.build, "")
+        self.assertEqual(str(v), f"{major + 1}.1.0")
+        self.assertGreater(v, f"{major + 1}.1.0-{prerelease}")
+
+        # Parsing is cached, bumping v must not change other versions of s
+        v = semver.SemVer(s)
+        self.assertEqual(v.prerelease, prerelease)
+        self.assertEqual(v.build, build)
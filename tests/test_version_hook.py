@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import io
-import pathlib
 import re
 import textwrap
 from pathlib import Path
@@ -12,8 +10,11 @@ from witch_ver.version import version_dict
 
 
 class TestVersionHook(base.TestBase):
+    @base.slow
     def test_get_version(self) -> None:
         path_orig = Path(witch_ver.__file__).with_name("version_hook.py").resolve()
+        # version_hook fetches from its parent folder so it needs to sit directly
+        # below the repository root (TEST_ROOT), not in the per-test folder
         path_test = self._TEST_ROOT.joinpath("version_hook.py")
 
         with path_orig.open(encoding="utf-8") as file:
@@ -61,80 +62,46 @@ class TestVersionHook(base.TestBase):
         with path_test.open("wb") as dst:
             dst.write(orig_file.encode())
 
-        original_open = io.open
-
-        calls = []
-
-        def mock_open(fname: str, *args, **kwargs) -> object:  # noqa: ANN002, ANN003
-            # subprocess calls io.open too, don't log those calls
-            if isinstance(fname, int):
-                return original_open(fname, *args, **kwargs)
-            calls.append({"file": fname, "args": args, "kwargs": kwargs})
-            # Retarget file operations to test file
-            return original_open(fname, *args, **kwargs)
-
-        try:
-            io.open = mock_open
-
-            # For 3.10 pathlib used an accessor model, mock that too
-            if self.is_py_3_10:
-                pathlib._normal_accessor.open = mock_open  # type: ignore[attr-defined] # noqa: SLF001
-
-            # Upon import, it will write to path_test
-            calls.clear()
+        # Upon import, it will write to path_test
+        with base.record_open() as modes:
             version_hook = self.import_file(path_test)
-            self.assertEqual(version_hook.version_dict, v)
-            self.assertEqual(len(calls), 2)
-            self.assertEqual(calls[0]["args"][0], "rb")
-            self.assertEqual(calls[1]["args"][0], "wb")
-            check_file(crlf=False)
-
-            # Cached, results, no file operations
-            calls.clear()
+        self.assertEqual(version_hook.version_dict, v)
+        self.assertEqual(modes, ["rb", "wb"])
+        check_file(crlf=False)
+
+        # Cached, results, no file operations
+        with base.record_open() as modes:
             result = version_hook._get_version()  # noqa: SLF001
-            self.assertEqual(result, v)
-            self.assertEqual(len(calls), 0)
-            check_file(crlf=False)
+        self.assertEqual(result, v)
+        self.assertEqual(modes, [])
+        check_file(crlf=False)
 
-            # No changes needed
-            calls.clear()
+        # No changes needed
+        with base.record_open() as modes:
             version_hook = self.import_file(path_test)
-            self.assertEqual(version_hook.version_dict, v)
-            self.assertEqual(len(calls), 1)
-            self.assertEqual(calls[0]["args"][0], "rb")
-            check_file(crlf=False)
-
-            # CRLF file
-            with path_test.open("wb") as file:
-                file.write(orig_file.encode().replace(b"\n", b"\r\n"))
-            calls.clear()
+        self.assertEqual(version_hook.version_dict, v)
+        self.assertEqual(modes, ["rb"])
+        check_file(crlf=False)
+
+        # CRLF file
+        with path_test.open("wb") as file:
+            file.write(orig_file.encode().replace(b"\n", b"\r\n"))
+        with base.record_open() as modes:
             version_hook = self.import_file(path_test)
-            self.assertEqual(version_hook.version_dict, v)
-            self.assertEqual(len(calls), 2)
-            self.assertEqual(calls[0]["args"][0], "rb")
-            self.assertEqual(calls[1]["args"][0], "wb")
-            check_file(crlf=True)
-
-            original_fetch = witch_ver.fetch
-
-            # Mock not in a git repository
-            def mock_fetch_catch(
-                *args,  # noqa: ARG001, ANN002
-                **kwargs,  # noqa: ARG001, ANN003
-            ) -> None:
-                raise RuntimeError
-
-            calls.clear()
-            try:
-                witch_ver.fetch = mock_fetch_catch
-
+        self.assertEqual(version_hook.version_dict, v)
+        self.assertEqual(modes, ["rb", "wb"])
+        check_file(crlf=True)
+
+        # Mock not in a git repository
+        def mock_fetch_catch(
+            *args,  # noqa: ARG001, ANN002
+            **kwargs,  # noqa: ARG001, ANN003
+        ) -> None:
+            raise RuntimeError
+
+        with base.swap_attr(witch_ver, "fetch", mock_fetch_catch):
+            with base.record_open() as modes:
                 version_hook = self.import_file(path_test)
-                result = version_hook.version_dict
-                self.assertEqual(result, v)
-                self.assertEqual(len(calls), 0)
-            finally:
-                witch_ver.fetch = original_fetch
-        finally:
-            io.open = original_open
-            if self.is_py_3_10:
-                pathlib._normal_accessor.open = original_open  # type: ignore[attr-defined] # noqa: SLF001
+            result = version_hook.version_dict
+            self.assertEqual(result, v)
+            self.assertEqual(modes, [])
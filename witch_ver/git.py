@@ -225,10 +225,19 @@ class GitVer(SemVer):
         return self._tag_prefix
 
 
+def _utc_now() -> datetime.datetime:
+    """Get the current time in UTC, a seam for tests to fix the clock.
+
+    Returns:
+        datetime.now in UTC
+    """
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
 def fetch(
     path: t.Union[str, os.PathLike],
     tag_prefix: t.Union[str, None] = "v",
-    describe_args: t.Union[t.List[str], None] = None,
+    describe_args: t.Union[t.Sequence[str], None] = None,
     custom_str_func: t.Union[t.Callable[[GitVer], str], None] = None,
     cache: t.Union[t.Dict[str, t.Any], None] = None,
     **kwargs: t.Union[str, int, bool, datetime.datetime, None, Path],
@@ -290,7 +299,7 @@ def fetch(
         kwargs["sha"] = ""
         kwargs["sha_abbrev"] = ""
         kwargs["branch"] = default_branch()
-        kwargs["date"] = datetime.datetime.now(datetime.timezone.utc)
+        kwargs["date"] = _utc_now()
         kwargs["distance"] = 0
         kwargs["tag"] = None
         kwargs["git_dir"] = git_dir
@@ -382,8 +391,6 @@ def fetch(
     kwargs["distance"] = distance
     kwargs["tag"] = tag
     kwargs["git_dir"] = git_dir
-
-    status, returncode = run_check(["status", "--porcelain"])
     kwargs["dirty"] = dirty
 
     return GitVer(
@@ -15,6 +15,9 @@ if TYPE_CHECKING:
     import setuptools
 
 
+REGEX_VERSION_DICT = re.compile(r"version_dict = ({.*?})", flags=re.S)
+REGEX_CONFIG = re.compile(r" *config = {.*?}", flags=re.S)
+
 # Boolean
 # Or a configuration
 # Or a function to produce a configuration
@@ -94,7 +97,7 @@ def use_witch_ver(
         if dst.exists():
             with dst.open(encoding="utf-8") as file:
                 buf = file.read()
-                buf = re.search(r"version_dict = ({.*?})", buf, flags=re.S)
+                buf = REGEX_VERSION_DICT.search(buf)
                 if buf is None:  # pragma: no cover
                     # Don't need coverage on debug code
                     msg = "Regex found to find version_dict"
@@ -119,7 +122,7 @@ def use_witch_ver(
             items.append(f'    "{k}": {v}')
     version_dict += ",\n".join(items)
     version_dict += ",\n}"
-    buf = re.sub(r"version_dict = {.*?}", version_dict, buf, count=1, flags=re.S)
+    buf = REGEX_VERSION_DICT.sub(version_dict, buf, count=1)
 
     # Save config to version_hook
     config_str = "config = {\n"
@@ -140,7 +143,7 @@ def use_witch_ver(
     config_str += ",\n".join(items)
     config_str += ",\n}"
     config_str = textwrap.indent(config_str, "    ")
-    version_py = re.sub(r" *config = {.*?}", config_str, buf, count=1, flags=re.S)
+    version_py = REGEX_CONFIG.sub(config_str, buf, count=1)
 
     for v in packages:
         # Copy version_hook
@@ -1,7 +1,9 @@
 """Semantic Versioning as described by https://semver.org/."""
 from __future__ import annotations
 
+import functools
 import re
+import sys
 import typing as t
 
 # From https://semver.org/
@@ -14,15 +16,114 @@ REGEX = re.compile(
     rf"(?P<patch>{_NUM_ID})"
     rf"(?:-(?P<prerelease>{_PRE_ID}(?:\.{_PRE_ID})*))?"
     rf"(?:\+(?P<build>{_BUILD_ID}(?:\.{_BUILD_ID})*))?$",
+    re.ASCII,
 )
 REGEX_NUM_ID = re.compile(rf"^{_NUM_ID}$")
 REGEX_PRE_ID = re.compile(rf"^{_PRE_ID}$")
 REGEX_BUILD_ID = re.compile(rf"^{_BUILD_ID}$")
+# Dot separated tags, validated in one pass
+# ASCII so \d is only 0-9, SemVer doesn't allow other Unicode digits
+_REGEX_PRE_IDS = re.compile(rf"{_PRE_ID}(?:\.{_PRE_ID})*", re.ASCII)
+_REGEX_BUILD_IDS = re.compile(rf"{_BUILD_ID}(?:\.{_BUILD_ID})*", re.ASCII)
+
+
+def _split_tags(s: str) -> t.Tuple[str, ...]:
+    """Split dot separated tags, interned since few tags are used repeatedly.
+
+    Args:
+        s: Validated tag.tag.tag string
+
+    Returns:
+        Tuple of each tag
+    """
+    return tuple(sys.intern(i) for i in s.split("."))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse(string: str) -> t.Tuple[int, int, int, t.Tuple[str, ...], t.Tuple[str, ...]]:
+    """Parse a SemVer string, cached since the same strings are parsed repeatedly.
+
+    Args:
+        string: String to parse
+
+    Returns:
+        (major, minor, patch, prerelease tags, build tags), all immutable so the
+        cached result is safe to share between SemVer objects
+
+    Raises:
+        ValueError if string does not match SemVer pattern
+    """
+    m = REGEX.fullmatch(string)
+    if m is None:
+        msg = f"String did not match SemVer pattern '{string}'"
+        raise ValueError(msg)
+    prerelease = m["prerelease"]
+    build = m["build"]
+    return (
+        int(m["major"]),
+        int(m["minor"]),
+        int(m["patch"]),
+        () if prerelease is None else _split_tags(prerelease),
+        () if build is None else _split_tags(build),
+    )
+
+
+# Ends every prerelease key and sorts after every identifier, so a release
+# outranks its prereleases and, not per spec, a prerelease outranks its longer
+# extensions
+_PRE_END = (2,)
+
+
+def _prerelease_key(prerelease: t.Iterable[str]) -> t.Tuple[t.Tuple[t.Any, ...], ...]:
+    """Get the precedence of prerelease tags as a tuple to compare natively.
+
+    Numeric identifiers compare numerically and lower than alphanumeric ones, as
+    in https://semver.org/#spec-item-11. Unlike the spec, a prerelease outranks
+    a longer one it is the start of (1.0.0-alpha > 1.0.0-alpha.1), legacy
+    behavior of witch-ver kept for compatibility.
+
+    Args:
+        prerelease: Prerelease tags, already validated
+
+    Returns:
+        Key of each tag followed by _PRE_END
+    """
+    # Tags are validated so all ASCII digits means a numeric identifier
+    return (
+        *((0, int(i)) if i.isascii() and i.isdigit() else (1, i) for i in prerelease),
+        _PRE_END,
+    )
+
+
+def _str_precedence(string: str) -> t.Tuple[t.Any, ...]:
+    """Get the precedence of a version string, without creating a SemVer.
+
+    Args:
+        string: String to parse
+
+    Returns:
+        (major, minor, patch, prerelease key)
+    """
+    # Compare against the cached parse
+    major, minor, patch, prerelease, _ = _parse(string)
+    return (major, minor, patch, _prerelease_key(prerelease))
 
 
 class SemVer:
     """Semantic Versioning as described by https://semver.org/."""
 
+    __slots__ = (
+        "_build",
+        "_build_str",
+        "_major",
+        "_minor",
+        "_patch",
+        "_pre_key",
+        "_prerelease",
+        "_prerelease_str",
+        "_str",
+    )
+
     def __init__(
         self,
         string: t.Union[str, None] = None,
@@ -51,20 +152,22 @@ class SemVer:
         self._major = 0
         self._minor = 0
         self._patch = 0
-        self._prerelease: t.List[str] = []
-        self._build: t.List[str] = []
+        # Immutable so empty and parsed tags are shared, not allocated per object
+        self._prerelease: t.Tuple[str, ...] = ()
+        self._build: t.Tuple[str, ...] = ()
+        # Cache of __str__, cleared by every mutation
+        self._str: t.Union[str, None] = None
+        # Caches of prerelease and build, cleared by mutating their tags
+        self._prerelease_str: t.Union[str, None] = None
+        self._build_str: t.Union[str, None] = None
+        # Cache of _prerelease_key, cleared by every prerelease mutation
+        self._pre_key: t.Union[t.Tuple[t.Tuple[t.Any, ...], ...], None] = None
 
         if string is not None:
-            m = REGEX.match(string)
-            if m is None:
-                msg = f"String did not match SemVer pattern '{string}'"
-                raise ValueError(msg)
-            m = m.groupdict()
-            major = int(m["major"])
-            minor = int(m["minor"])
-            patch = int(m["patch"])
-            prerelease = m["prerelease"]
-            build = m["build"]
+            # Tags were validated by REGEX
+            major, minor, patch, self._prerelease, self._build = _parse(string)
+            prerelease = None
+            build = None
 
         if major is None or minor is None or patch is None:
             msg = "SemVer() takes a string or major, minor, & patch"
@@ -91,14 +194,16 @@ class SemVer:
 
     def __str__(self) -> str:
         """Formatted semantic version string."""
-        buf = self.core
-        if len(self._prerelease) > 0:
-            buf += "-"
-            buf += self.prerelease
-        if len(self._build) > 0:
-            buf += "+"
-            buf += self.build
-        return buf
+        if self._str is None:
+            buf = self.core
+            if len(self._prerelease) > 0:
+                buf += "-"
+                buf += self.prerelease
+            if len(self._build) > 0:
+                buf += "+"
+                buf += self.build
+            self._str = buf
+        return self._str
 
     def __repr__(self) -> str:
         """Representation debug string."""
@@ -113,25 +218,43 @@ class SemVer:
             obj: Of type SemVer or a string
 
         Returns:
-            True if all parts are equal, False otherwise
+            True if all parts are equal, False otherwise, NotImplemented for other
+            types
         """
-        if isinstance(obj, str):
-            obj = SemVer(obj)
-        elif not isinstance(obj, SemVer):
-            msg = f"Cannot compare SemVer to {type(obj)}"
-            raise TypeError(msg)
-
-        if self._major != obj._major:
-            return False
-        if self._minor != obj._minor:
-            return False
-        if self._patch != obj._patch:
+        if isinstance(obj, SemVer):
+            # Compare parts directly, no copies
+            return (
+                self._major == obj._major
+                and self._minor == obj._minor
+                and self._patch == obj._patch
+                and self._prerelease == obj._prerelease
+                and self._build == obj._build
+            )
+        if not isinstance(obj, str):
+            # Let Python try the reflected comparison or fall back to identity
+            return NotImplemented
+        # Compare against the cached parse, no SemVer needed
+        try:
+            parts = _parse(obj)
+        except ValueError:
+            # Not a version so not equal
             return False
-        if self._prerelease != obj._prerelease:
-            return False
-        if self._build != obj._build:
-            return False
-        return True
+        return parts == (
+            self._major,
+            self._minor,
+            self._patch,
+            self._prerelease,
+            self._build,
+        )
+
+    def __hash__(self) -> int:
+        """Hash of the semantic version string, equal to the hash of that string.
+
+        Don't modify a SemVer while it is used as a key.
+        """
+        # The string is cached and a str caches its own hash, GitVer overrides
+        # __str__ so call SemVer's for the plain semantic version
+        return hash(SemVer.__str__(self))
 
     def __gt__(self, obj: object) -> bool:
         """Compare SemVer for greater-than.
@@ -142,62 +265,51 @@ class SemVer:
             obj: Of type SemVer or a string
 
         Returns:
-            True if all parts are equal, False otherwise
+            True if self has higher precedence, False otherwise, NotImplemented for
+            other types so Python raises TypeError
         """
+        if isinstance(obj, SemVer):
+            return self._precedence() > obj._precedence()
         if isinstance(obj, str):
-            obj = SemVer(obj)
-        elif not isinstance(obj, SemVer):
-            msg = f"Cannot compare SemVer to {type(obj)}"
-            raise TypeError(msg)
-
-        if self._major > obj._major:
-            return True
-        if self._minor > obj._minor:
-            return True
-        if self._patch > obj._patch:
-            return True
-        for this, other in zip(self._prerelease, obj._prerelease):
-            if REGEX_NUM_ID.match(this):
-                this_i = int(this)
-                if REGEX_NUM_ID.match(other):
-                    other_i = int(other)
-                    if this_i > other_i:
-                        return True
-                # this is number
-                # other is alphanumeric
-            else:
-                if REGEX_NUM_ID.match(other):
-                    # this is alphanumeric
-                    # other is number
-                    return True
-                # Both are alphanumeric, compare lexically
-                if this > other:
-                    return True
-        return len(self._prerelease) < len(obj._prerelease)
+            return self._precedence() > _str_precedence(obj)
+        return NotImplemented
 
     def __ge__(self, obj: object) -> bool:
         """Compare version for greater-equal."""
-        return (self > obj) or (self == obj)
+        if isinstance(obj, SemVer):
+            return self._precedence() >= obj._precedence()
+        if isinstance(obj, str):
+            return self._precedence() >= _str_precedence(obj)
+        return NotImplemented
 
     def __lt__(self, obj: object) -> bool:
         """Compare version for less-than."""
+        # Precedence is a total order
         return not self >= obj
 
     def __le__(self, obj: object) -> bool:
         """Compare version for less-equal."""
         return not self > obj
 
+    def _precedence(self) -> t.Tuple[t.Any, ...]:
+        """Get the precedence as a tuple to compare natively.
+
+        Build metadata is ignored, see https://semver.org/#spec-item-11
+
+        Returns:
+            (major, minor, patch, prerelease key)
+        """
+        if self._pre_key is None:
+            self._pre_key = _prerelease_key(self._prerelease)
+        return (self._major, self._minor, self._patch, self._pre_key)
+
     def bump_major(self) -> None:
         """Bump major revision number.
 
         Adds one to major.
         Resets minor, patch, prerelease, and build
         """
-        self._major += 1
-        self._minor = 0
-        self._patch = 0
-        self.clear_prerelease()
-        self.clear_build()
+        self._reset(self._major + 1, 0, 0)
 
     def bump_minor(self) -> None:
         """Bump minor revision number.
@@ -205,10 +317,7 @@ class SemVer:
         Adds one to minor.
         Resets patch, prerelease, and build
         """
-        self._minor += 1
-        self._patch = 0
-        self.clear_prerelease()
-        self.clear_build()
+        self._reset(self._major, self._minor + 1, 0)
 
     def bump_patch(self) -> None:
         """Bump patch revision number.
@@ -216,13 +325,33 @@ class SemVer:
         Adds one to patch.
         Resets prerelease, and build
         """
-        self._patch += 1
-        self.clear_prerelease()
-        self.clear_build()
+        self._reset(self._major, self._minor, self._patch + 1)
+
+    def _reset(self, major: int, minor: int, patch: int) -> None:
+        """Set version core and clear all tags, in one step for bumping.
+
+        Args:
+            major: Major revision number
+            minor: Minor revision number
+            patch: Patch revision number
+        """
+        self._major = major
+        self._minor = minor
+        self._patch = patch
+        self._prerelease = ()
+        self._build = ()
+        self._str = None
+        self._prerelease_str = None
+        self._build_str = None
+        # No prerelease tags, key is known
+        self._pre_key = (_PRE_END,)
 
     def clear_prerelease(self) -> None:
         """Clear prerelease tags."""
-        self._prerelease = []
+        self._prerelease = ()
+        self._str = None
+        self._prerelease_str = None
+        self._pre_key = None
 
     def append_prerelease(self, s: str) -> None:
         """Append prerelease tag.
@@ -230,15 +359,19 @@ class SemVer:
         Args:
           s: String tag to append or multiple tag.tag.tag
         """
-        for i in s.split("."):
-            if not REGEX_PRE_ID.match(i):
-                msg = f"Prerelease tag does not match SemVer pattern '{i}'"
-                raise ValueError(msg)
-            self._prerelease.append(i)
+        if not _REGEX_PRE_IDS.fullmatch(s):
+            msg = f"Prerelease tag does not match SemVer pattern '{s}'"
+            raise ValueError(msg)
+        self._prerelease += _split_tags(s)
+        self._str = None
+        self._prerelease_str = None
+        self._pre_key = None
 
     def clear_build(self) -> None:
         """Clear build tags."""
-        self._build = []
+        self._build = ()
+        self._str = None
+        self._build_str = None
 
     def append_build(self, s: str) -> None:
         """Append prerelease tag.
@@ -246,11 +379,12 @@ class SemVer:
         Args:
           s: String tag to append or multiple tag.tag.tag
         """
-        for i in s.split("."):
-            if not REGEX_BUILD_ID.match(i):
-                msg = f"Build tag does not match SemVer pattern '{i}'"
-                raise ValueError(msg)
-            self._build.append(i)
+        if not _REGEX_BUILD_IDS.fullmatch(s):
+            msg = f"Build tag does not match SemVer pattern '{s}'"
+            raise ValueError(msg)
+        self._build += _split_tags(s)
+        self._str = None
+        self._build_str = None
 
     @property
     def major(self) -> int:
@@ -269,23 +403,27 @@ class SemVer:
 
     @property
     def prerelease_list(self) -> t.List[str]:
-        """Prerelease tags as a list."""
-        return self._prerelease
+        """Prerelease tags as a list, a copy."""
+        return list(self._prerelease)
 
     @property
     def prerelease(self) -> str:
         """Prerelease tags as a single string."""
-        return ".".join(self._prerelease)
+        if self._prerelease_str is None:
+            self._prerelease_str = ".".join(self._prerelease)
+        return self._prerelease_str
 
     @property
     def build_list(self) -> t.List[str]:
-        """Build tags as a list."""
-        return self._build
+        """Build tags as a list, a copy."""
+        return list(self._build)
 
     @property
     def build(self) -> str:
         """Build tags as a single string."""
-        return ".".join(self._build)
+        if self._build_str is None:
+            self._build_str = ".".join(self._build)
+        return self._build_str
 
     @property
     def core(self) -> str: